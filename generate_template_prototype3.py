@@ -1,244 +1,493 @@
-import datetime
-import calendar
-import csv
-import os
-from collections import defaultdict
-
-class TaskScheduler:
-    def __init__(self):
-        self.tasks = {}  # {task_name: {'intervals': [days], 'start_date': date}}
-        self.schedule = defaultdict(list)  # {date: [tasks]}
-        
-    def add_task(self, task_name, intervals, start_date=None):
-        """
-        Add a new task with revision intervals
-        
-        Parameters:
-        - task_name: Name of the chapter/task
-        - intervals: List of days when to review (e.g., [1, 3, 7, 14, 30])
-        - start_date: When to start the task (defaults to today)
-        """
-        if start_date is None:
-            start_date = datetime.date.today()
-        
-        self.tasks[task_name] = {
-            'intervals': intervals,
-            'start_date': start_date
-        }
-        
-        # Schedule the task based on intervals
-        for interval in intervals:
-            review_date = start_date + datetime.timedelta(days=interval)
-            self.schedule[review_date].append(task_name)
-    
-    def add_task_with_repetitions(self, task_name, interval, repetitions, start_date=None):
-        """
-        Add a new task with a fixed interval repeated multiple times
-        
-        Parameters:
-        - task_name: Name of the chapter/task
-        - interval: Number of days between repetitions
-        - repetitions: Number of times to repeat the task
-        - start_date: When to start the task (defaults to today)
-        """
-        if start_date is None:
-            start_date = datetime.date.today()
-        
-        # Calculate intervals based on repetitions
-        intervals = []
-        current_interval = 0
-        
-        for _ in range(repetitions):
-            intervals.append(current_interval)
-            current_interval += interval
-        
-        self.add_task(task_name, intervals, start_date)
-    
-    def generate_schedule(self, days=90):
-        """Generate a schedule for the specified number of days"""
-        start_date = datetime.date.today()
-        end_date = start_date + datetime.timedelta(days=days)
-        
-        # Clear existing schedule
-        self.schedule = defaultdict(list)
-        
-        # Regenerate schedule
-        for task_name, task_info in self.tasks.items():
-            for interval in task_info['intervals']:
-                review_date = task_info['start_date'] + datetime.timedelta(days=interval)
-                if start_date <= review_date <= end_date:
-                    self.schedule[review_date].append(task_name)
-    
-    def get_tasks_for_date(self, date):
-        """Get all tasks scheduled for a specific date"""
-        return self.schedule.get(date, [])
-    
-    def export_to_csv(self, filename="schedule.csv"):
-        """Export the schedule to a CSV file"""
-        with open(filename, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['Date', 'Day', 'Tasks'])
-            
-            # Sort dates
-            sorted_dates = sorted(self.schedule.keys())
-            
-            for date in sorted_dates:
-                day_name = calendar.day_name[date.weekday()]
-                tasks = ', '.join(self.schedule[date])
-                writer.writerow([date.strftime('%Y-%m-%d'), day_name, tasks])
-        
-        return filename
-    
-    def print_monthly_calendar(self, year=None, month=None):
-        """Print a monthly calendar with tasks"""
-        if year is None or month is None:
-            today = datetime.date.today()
-            year = today.year
-            month = today.month
-        
-        # Get the calendar for the month
-        cal = calendar.monthcalendar(year, month)
-        month_name = calendar.month_name[month]
-        
-        print(f"\n{month_name} {year}")
-        print("Mon Tue Wed Thu Fri Sat Sun")
-        
-        for week in cal:
-            week_str = ""
-            for day in week:
-                if day == 0:
-                    week_str += "    "
-                else:
-                    date = datetime.date(year, month, day)
-                    task_count = len(self.schedule.get(date, []))
-                    if task_count > 0:
-                        week_str += f"{day:2d}* "
-                    else:
-                        week_str += f"{day:2d}  "
-            print(week_str)
-        
-        # Print tasks for the month
-        print("\nTasks this month:")
-        for day in range(1, calendar.monthrange(year, month)[1] + 1):
-            date = datetime.date(year, month, day)
-            tasks = self.schedule.get(date, [])
-            if tasks:
-                print(f"{date.strftime('%Y-%m-%d')} ({calendar.day_name[date.weekday()]}): {', '.join(tasks)}")
-
-
-def main():
-    scheduler = TaskScheduler()
-    
-    print("===== Task Revision Scheduler =====")
-    print("This program helps you schedule when to revise chapters/tasks.")
-    
-    while True:
-        print("\nOptions:")
-        print("1. Add a new task/chapter with custom intervals")
-        print("2. Add a new task/chapter with fixed interval and repetitions")
-        print("3. View schedule for a specific date")
-        print("4. View monthly calendar")
-        print("5. Export schedule to CSV")
-        print("6. Exit")
-        
-        choice = input("\nEnter your choice (1-6): ")
-        
-        if choice == '1':
-            task_name = input("Enter task/chapter name: ")
-            
-            print("Enter revision intervals in days (comma-separated)")
-            print("Example: 1,3,7,14,30 (review after 1 day, 3 days, etc.)")
-            intervals_input = input("Intervals: ")
-            
-            try:
-                intervals = [int(x.strip()) for x in intervals_input.split(',')]
-                
-                start_date_input = input("Start date (YYYY-MM-DD) or leave blank for today: ")
-                if start_date_input:
-                    start_date = datetime.datetime.strptime(start_date_input, "%Y-%m-%d").date()
-                else:
-                    start_date = datetime.date.today()
-                
-                scheduler.add_task(task_name, intervals, start_date)
-                print(f"Task '{task_name}' added successfully!")
-                
-            except ValueError:
-                print("Invalid input. Please enter valid numbers for intervals.")
-        
-        elif choice == '2':
-            task_name = input("Enter task/chapter name: ")
-            
-            try:
-                interval = int(input("Enter interval between repetitions (in days): "))
-                repetitions = int(input("Enter number of repetitions: "))
-                
-                start_date_input = input("Start date (YYYY-MM-DD) or leave blank for today: ")
-                if start_date_input:
-                    start_date = datetime.datetime.strptime(start_date_input, "%Y-%m-%d").date()
-                else:
-                    start_date = datetime.date.today()
-                
-                scheduler.add_task_with_repetitions(task_name, interval, repetitions, start_date)
-                
-                # Show the scheduled dates
-                print(f"\nTask '{task_name}' scheduled for:")
-                for i in range(repetitions):
-                    review_date = start_date + datetime.timedelta(days=i*interval)
-                    print(f"  {review_date.strftime('%Y-%m-%d')} ({calendar.day_name[review_date.weekday()]})")
-                
-            except ValueError:
-                print("Invalid input. Please enter valid numbers for interval and repetitions.")
-        
-        elif choice == '3':
-            date_input = input("Enter date (YYYY-MM-DD) or leave blank for today: ")
-            
-            try:
-                if date_input:
-                    date = datetime.datetime.strptime(date_input, "%Y-%m-%d").date()
-                else:
-                    date = datetime.date.today()
-                
-                tasks = scheduler.get_tasks_for_date(date)
-                
-                print(f"\nTasks for {date.strftime('%Y-%m-%d')} ({calendar.day_name[date.weekday()]}):")
-                if tasks:
-                    for i, task in enumerate(tasks, 1):
-                        print(f"{i}. {task}")
-                else:
-                    print("No tasks scheduled for this date.")
-                    
-            except ValueError:
-                print("Invalid date format. Please use YYYY-MM-DD.")
-        
-        elif choice == '4':
-            try:
-                year_input = input("Enter year (YYYY) or leave blank for current year: ")
-                month_input = input("Enter month (1-12) or leave blank for current month: ")
-                
-                year = int(year_input) if year_input else datetime.date.today().year
-                month = int(month_input) if month_input else datetime.date.today().month
-                
-                scheduler.print_monthly_calendar(year, month)
-                
-            except ValueError:
-                print("Invalid input. Please enter valid year and month.")
-        
-        elif choice == '5':
-            filename = input("Enter filename (default: schedule.csv): ")
-            if not filename:
-                filename = "schedule.csv"
-            
-            scheduler.generate_schedule()
-            file_path = scheduler.export_to_csv(filename)
-            print(f"Schedule exported to {os.path.abspath(file_path)}")
-        
-        elif choice == '6':
-            print("Thank you for using the Task Scheduler. Goodbye!")
-            break
-        
-        else:
-            print("Invalid choice. Please enter a number between 1 and 6.")
-
-
-if __name__ == "__main__":
-    main()
+import array
+import bisect
+import datetime
+import calendar
+import csv
+import functools
+import os
+import sys
+
+# calendar.day_name formats each name on lookup, so take a snapshot once
+DAY_NAMES = tuple(calendar.day_name)
+
+# Ordinal of date.max; review days past it can never be shown
+MAX_ORDINAL = datetime.date.max.toordinal()
+
+
+def ord_to_ymd(o):
+    """
+    Convert a proleptic Gregorian ordinal (date.toordinal()) to (year, month, day)
+    
+    Uses Neri-Schneider/Hinnant civil-from-days arithmetic on a calendar that
+    starts in March, so leap days fall at the end of the year and no
+    leap-year branching is needed.
+    """
+    z = o + 305  # days since 0000-03-01
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 - 12 * (mp >= 10)
+    year = era * 400 + yoe + (month <= 2)
+    return year, month, day
+
+
+def ymd_to_ord(year, month, day):
+    """Convert (year, month, day) to a proleptic Gregorian ordinal, the inverse of ord_to_ymd"""
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 305
+
+
+def format_ord(o):
+    """Format a proleptic Gregorian ordinal as date.strftime('%Y-%m-%d') would"""
+    year, month, day = ord_to_ymd(o)
+    return f"{year}-{month:02d}-{day:02d}"
+
+
+# Our own Monday-first calendar, matching the "Mon ... Sun" header and not
+# affected by calendar.setfirstweekday()
+_CALENDAR = calendar.Calendar(calendar.MONDAY)
+
+
+@functools.lru_cache(maxsize=512)
+def _month_cal(year, month):
+    """Cached month grid of day numbers, as tuples so callers can't mutate the cache"""
+    return tuple(tuple(week) for week in _CALENDAR.monthdayscalendar(year, month))
+
+
+@functools.lru_cache(maxsize=512)
+def _month_len(year, month):
+    """Cached number of days in the month"""
+    return calendar.monthrange(year, month)[1]
+
+
+class TaskScheduler:
+    # Bound once so hot paths skip the module attribute lookups
+    _today = staticmethod(datetime.date.today)
+    _day_name = DAY_NAMES
+    _month_name = calendar.month_name
+    
+    def __init__(self):
+        # {task_name: {'intervals': array of days, 'start_date': date,
+        #              'ords': sorted array of ordinals}}
+        self.tasks = {}
+        self.schedule = {}  # {date ordinal: [tasks]}
+        self._sorted_ords = []  # keys of self.schedule in order, or None until re-sorted
+        self._window = None  # (start ordinal, end ordinal) of the last generate_schedule
+        self._dirty_tasks = set()  # tasks added since the last generate_schedule
+        self._rebuild = False  # a task was re-added, leaving its old entries stale
+        
+    def add_task(self, task_name, intervals, start_date=None):
+        """
+        Add a new task with revision intervals
+        
+        Parameters:
+        - task_name: Name of the chapter/task
+        - intervals: List of days when to review (e.g., [1, 3, 7, 14, 30])
+        - start_date: When to start the task (defaults to today)
+        
+        Raises ValueError if any interval is negative. Intervals that would
+        land past date.max are dropped.
+        """
+        if start_date is None:
+            start_date = self._today()
+        
+        # Every review day holds a reference to the name, so share one copy;
+        # sys.intern only takes exact str, other names are kept as given
+        if type(task_name) is str:
+            task_name = sys.intern(task_name)
+        
+        # Keep intervals and review days as packed int64 arrays rather than
+        # lists of int objects, and work out review days as proleptic
+        # ordinals instead of building a timedelta per interval. Review days
+        # are kept sorted so generate_schedule can bisect to its window.
+        # Check the raw values, before a huge negative can overflow the array
+        intervals = list(intervals)
+        if intervals and min(intervals) < 0:
+            raise ValueError("Intervals must not be negative")
+        start_ord = start_date.toordinal()
+        max_interval = MAX_ORDINAL - start_ord
+        intervals = array.array(
+            'q', [interval for interval in intervals if interval <= max_interval]
+        )
+        ords = array.array('q', sorted([start_ord + interval for interval in intervals]))
+        
+        if task_name in self.tasks:
+            self._rebuild = True
+        self.tasks[task_name] = {
+            'intervals': intervals,
+            'start_date': start_date,
+            'ords': ords
+        }
+        
+        # Schedule the task based on intervals; most review days are new
+        # days, so create their list directly
+        schedule = self.schedule
+        new_day = False
+        for o in ords:
+            tasks = schedule.get(o)
+            if tasks is None:
+                schedule[o] = [task_name]
+                new_day = True
+            else:
+                tasks.append(task_name)
+        
+        # Re-sort the day index lazily rather than inserting into it per day
+        if new_day:
+            self._sorted_ords = None
+        self._dirty_tasks.add(task_name)
+    
+    def add_task_with_repetitions(self, task_name, interval, repetitions, start_date=None):
+        """
+        Add a new task with a fixed interval repeated multiple times
+        
+        Parameters:
+        - task_name: Name of the chapter/task
+        - interval: Number of days between repetitions
+        - repetitions: Number of times to repeat the task
+        - start_date: When to start the task (defaults to today)
+        
+        Raises ValueError if interval is negative. A positive interval caps
+        repetitions at the last one before date.max; an interval of 0 puts
+        every repetition on start_date, so repetitions is used as given.
+        """
+        if start_date is None:
+            start_date = self._today()
+        
+        if interval < 0:
+            raise ValueError("Interval must not be negative")
+        
+        # Repetitions past date.max can never be scheduled, so don't generate them
+        if interval:
+            repetitions = min(repetitions, (MAX_ORDINAL - start_date.toordinal()) // interval + 1)
+        
+        # Calculate intervals based on repetitions
+        intervals = [i * interval for i in range(repetitions)]
+        
+        self.add_task(task_name, intervals, start_date)
+    
+    def generate_schedule(self, days=90):
+        """Generate a schedule for the specified number of days"""
+        start_ord = self._today().toordinal()
+        end_ord = start_ord + days
+        window = (start_ord, end_ord)
+        
+        # Nothing added and same window: the schedule is already up to date
+        if window == self._window and not self._dirty_tasks:
+            return
+        
+        if self._window is None or self._rebuild:
+            # Clear existing schedule
+            self.schedule = {}
+            
+            # Regenerate schedule from the ordinals cached in add_task,
+            # visiting only each task's slice that falls in the window
+            schedule = self.schedule
+            for task_name, task_info in self.tasks.items():
+                ords = task_info['ords']
+                lo = bisect.bisect_left(ords, start_ord)
+                hi = bisect.bisect_right(ords, end_ord)
+                for o in ords[lo:hi]:
+                    tasks = schedule.get(o)
+                    if tasks is None:
+                        schedule[o] = [task_name]
+                    else:
+                        tasks.append(task_name)
+            self._sorted_ords = None
+        else:
+            old_start, old_end = self._window
+            schedule = self.schedule
+            
+            # add_task inserted every review day of the new tasks. Days outside
+            # the old window can only hold new tasks, so dropping them brings
+            # the schedule back in line with the old window.
+            for task_name in self._dirty_tasks:
+                ords = self.tasks[task_name]['ords']
+                lo = bisect.bisect_left(ords, old_start)
+                hi = max(bisect.bisect_right(ords, old_end), lo)
+                for o in ords[:lo]:
+                    schedule.pop(o, None)
+                for o in ords[hi:]:
+                    schedule.pop(o, None)
+                self._sorted_ords = None
+            
+            if window != self._window:
+                # The window moved: drop days that left it and fill in the
+                # days that entered it
+                sorted_ords = self._sorted_keys()
+                lo = bisect.bisect_left(sorted_ords, start_ord)
+                # A negative days gives an empty window; keep hi from passing lo
+                hi = max(bisect.bisect_right(sorted_ords, end_ord), lo)
+                for o in sorted_ords[:lo] + sorted_ords[hi:]:
+                    del schedule[o]
+                sorted_ords = sorted_ords[lo:hi]
+                
+                new_days = []
+                for task_name, task_info in self.tasks.items():
+                    ords = task_info['ords']
+                    lo = bisect.bisect_left(ords, start_ord)
+                    hi = bisect.bisect_right(ords, end_ord)
+                    for o in ords[lo:hi]:
+                        if not old_start <= o <= old_end:
+                            tasks = schedule.get(o)
+                            if tasks is None:
+                                schedule[o] = [task_name]
+                                new_days.append(o)
+                            else:
+                                tasks.append(task_name)
+                
+                # Timsort merges the already-sorted runs, so this stays cheap
+                self._sorted_ords = sorted(sorted_ords + new_days) if new_days else sorted_ords
+        
+        self._window = window
+        self._dirty_tasks.clear()
+        self._rebuild = False
+    
+    def get_tasks_for_date(self, date):
+        """Get all tasks scheduled for a specific date"""
+        return self.schedule.get(date.toordinal(), [])
+    
+    def _sorted_keys(self):
+        """Get the scheduled date ordinals in order, re-sorting if the index is stale"""
+        if self._sorted_ords is None:
+            self._sorted_ords = sorted(self.schedule)
+        return self._sorted_ords
+    
+    def iter_range(self, lo_ord, hi_ord):
+        """Get the scheduled date ordinals between lo_ord and hi_ord (inclusive), in order"""
+        sorted_ords = self._sorted_keys()
+        lo = bisect.bisect_left(sorted_ords, lo_ord)
+        hi = bisect.bisect_right(sorted_ords, hi_ord)
+        return sorted_ords[lo:hi]
+    
+    def iter_rows(self):
+        """Yield (date, day, tasks) rows for the schedule in date order"""
+        schedule = self.schedule
+        day_name = self._day_name
+        
+        # Format rows straight from the ordinal; ordinal 1 is a Monday
+        for o in self._sorted_keys():
+            yield format_ord(o), day_name[(o + 6) % 7], ', '.join(schedule[o])
+    
+    def export_to_csv(self, filename="schedule.csv"):
+        """Export the schedule to a CSV file"""
+        with open(filename, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Date', 'Day', 'Tasks'])
+            writer.writerows(self.iter_rows())
+        
+        return filename
+    
+    def print_monthly_calendar(self, year=None, month=None):
+        """Print a monthly calendar with tasks"""
+        if year is None or month is None:
+            today = self._today()
+            year = today.year
+            month = today.month
+        
+        # ymd_to_ord doesn't range-check, so reject years date() wouldn't accept
+        if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            raise ValueError(f"year {year} is out of range")
+        
+        # Get the calendar for the month
+        cal = _month_cal(year, month)
+        month_name = self._month_name[month]
+        day_name = self._day_name
+        
+        # Day n of the month is ordinal_base + n in the schedule
+        ordinal_base = ymd_to_ord(year, month, 1) - 1
+        schedule = self.schedule
+        
+        lines = [f"\n{month_name} {year}", "Mon Tue Wed Thu Fri Sat Sun"]
+        lines.extend(
+            "".join(
+                "    " if day == 0
+                else f"{day:2d}* " if schedule.get(ordinal_base + day)
+                else f"{day:2d}  "
+                for day in week
+            )
+            for week in cal
+        )
+        print("\n".join(lines))
+        
+        # Print tasks for the month
+        month_ords = self.iter_range(ordinal_base + 1, ordinal_base + _month_len(year, month))
+        
+        print("\nTasks this month:")
+        for o in month_ords:
+            date_str = f"{year}-{month:02d}-{o - ordinal_base:02d}"
+            print(f"{date_str} ({day_name[(o + 6) % 7]}): {', '.join(schedule[o])}")
+
+
+def parse_date(text):
+    """
+    Parse a YYYY-MM-DD date as strptime('%Y-%m-%d') would
+    
+    Zero-padded input takes the date.fromisoformat fast path; anything else
+    (e.g. 2024-1-5) falls back to strptime, so ISO forms strptime rejects,
+    like 20240105 or 2024-W01-1, stay invalid.
+    """
+    if len(text) == 10 and text[4] == text[7] == '-':
+        try:
+            return datetime.date.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def add_custom_task(scheduler):
+    """Menu option 1: add a task with custom intervals"""
+    task_name = input("Enter task/chapter name: ")
+    
+    print("Enter revision intervals in days (comma-separated)")
+    print("Example: 1,3,7,14,30 (review after 1 day, 3 days, etc.)")
+    intervals_input = input("Intervals: ")
+    
+    try:
+        intervals = [int(x.strip()) for x in intervals_input.split(',')]
+        
+        start_date_input = input("Start date (YYYY-MM-DD) or leave blank for today: ")
+        if start_date_input:
+            start_date = parse_date(start_date_input)
+        else:
+            start_date = None  # the scheduler defaults to today
+        
+        scheduler.add_task(task_name, intervals, start_date)
+        print(f"Task '{task_name}' added successfully!")
+        
+    except ValueError:
+        print("Invalid input. Please enter valid numbers for intervals.")
+
+
+def add_repeated_task(scheduler):
+    """Menu option 2: add a task with a fixed interval and repetitions"""
+    task_name = input("Enter task/chapter name: ")
+    
+    try:
+        interval = int(input("Enter interval between repetitions (in days): "))
+        repetitions = int(input("Enter number of repetitions: "))
+        
+        start_date_input = input("Start date (YYYY-MM-DD) or leave blank for today: ")
+        if start_date_input:
+            start_date = parse_date(start_date_input)
+        else:
+            start_date = None  # the scheduler defaults to today
+        
+        scheduler.add_task_with_repetitions(task_name, interval, repetitions, start_date)
+        
+        # Show the scheduled dates
+        print(f"\nTask '{task_name}' scheduled for:")
+        for o in scheduler.tasks[task_name]['ords']:
+            print(f"  {format_ord(o)} ({DAY_NAMES[(o + 6) % 7]})")
+        
+    except ValueError:
+        print("Invalid input. Please enter valid numbers for interval and repetitions.")
+
+
+def view_date(scheduler):
+    """Menu option 3: show the tasks for one date"""
+    date_input = input("Enter date (YYYY-MM-DD) or leave blank for today: ")
+    
+    try:
+        if date_input:
+            date = parse_date(date_input)
+        else:
+            date = scheduler._today()
+        
+        tasks = scheduler.get_tasks_for_date(date)
+        
+        o = date.toordinal()
+        print(f"\nTasks for {format_ord(o)} ({DAY_NAMES[(o + 6) % 7]}):")
+        if tasks:
+            for i, task in enumerate(tasks, 1):
+                print(f"{i}. {task}")
+        else:
+            print("No tasks scheduled for this date.")
+            
+    except ValueError:
+        print("Invalid date format. Please use YYYY-MM-DD.")
+
+
+def view_month(scheduler):
+    """Menu option 4: show the monthly calendar"""
+    try:
+        year_input = input("Enter year (YYYY) or leave blank for current year: ")
+        month_input = input("Enter month (1-12) or leave blank for current month: ")
+        
+        if not (year_input and month_input):
+            today = scheduler._today()
+        year = int(year_input) if year_input else today.year
+        month = int(month_input) if month_input else today.month
+        
+        scheduler.print_monthly_calendar(year, month)
+        
+    except ValueError:
+        print("Invalid input. Please enter valid year and month.")
+
+
+def export_csv(scheduler):
+    """Menu option 5: export the schedule to CSV"""
+    filename = input("Enter filename (default: schedule.csv): ")
+    if not filename:
+        filename = "schedule.csv"
+    
+    scheduler.generate_schedule()
+    file_path = scheduler.export_to_csv(filename)
+    print(f"Schedule exported to {os.path.abspath(file_path)}")
+
+
+def exit_program(scheduler):
+    """Menu option 6: say goodbye and stop the main loop"""
+    print("Thank you for using the Task Scheduler. Goodbye!")
+    return True
+
+
+def invalid_choice(scheduler):
+    """Fallback for anything that isn't a menu option"""
+    print("Invalid choice. Please enter a number between 1 and 6.")
+
+
+MENU = "\n".join([
+    "\nOptions:",
+    "1. Add a new task/chapter with custom intervals",
+    "2. Add a new task/chapter with fixed interval and repetitions",
+    "3. View schedule for a specific date",
+    "4. View monthly calendar",
+    "5. Export schedule to CSV",
+    "6. Exit",
+])
+
+# Menu choice -> handler; a handler returns True to end the program
+MENU_HANDLERS = {
+    '1': add_custom_task,
+    '2': add_repeated_task,
+    '3': view_date,
+    '4': view_month,
+    '5': export_csv,
+    '6': exit_program,
+}
+
+
+def main():
+    scheduler = TaskScheduler()
+    
+    print("===== Task Revision Scheduler =====")
+    print("This program helps you schedule when to revise chapters/tasks.")
+    
+    while True:
+        print(MENU)
+        
+        choice = input("\nEnter your choice (1-6): ")
+        
+        if MENU_HANDLERS.get(choice, invalid_choice)(scheduler):
+            break
+
+
+if __name__ == "__main__":
+    main()